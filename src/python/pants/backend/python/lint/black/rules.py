@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import math
+from dataclasses import dataclass
 from typing import cast
 
 from pants.backend.python.lint.black.subsystem import Black, BlackFieldSet
@@ -12,11 +14,12 @@ from pants.backend.python.util_rules.interpreter_constraints import InterpreterC
 from pants.backend.python.util_rules.pex import PexRequest, VenvPex, VenvPexProcess
 from pants.core.goals.fmt import AbstractFmtRequest, FmtResult, FmtTargetsRequest, Partitions
 from pants.core.util_rules.config_files import ConfigFiles, ConfigFilesRequest
-from pants.engine.fs import Digest, MergeDigests
+from pants.engine.fs import EMPTY_DIGEST, Digest, MergeDigests, Snapshot
 from pants.engine.process import ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.util.logging import LogLevel
-from pants.util.strutil import pluralize, softwrap
+from pants.util.ordered_set import FrozenOrderedSet
+from pants.util.strutil import Simplifier, pluralize, softwrap
 
 
 class BlackRequest(FmtTargetsRequest):
@@ -24,45 +27,96 @@ class BlackRequest(FmtTargetsRequest):
     tool_subsystem = Black
 
 
-async def _run_black(
-    request: AbstractFmtRequest.Batch,
-    black: Black,
-    interpreter_constraints: InterpreterConstraints,
-) -> FmtResult:
-    black_pex_get = Get(
+@dataclass(frozen=True)
+class _BlackVenvRequest:
+    interpreter_constraints: InterpreterConstraints
+
+
+@rule
+async def black_venv(request: _BlackVenvRequest, black: Black) -> VenvPex:
+    """Resolve the Black PEX keyed only on interpreter constraints.
+
+    Batches with different field sets frequently share interpreter constraints, so routing the
+    resolution through this rule lets the engine memoize one VenvPex per constraint set rather
+    than one per batch.
+    """
+    return await Get(
         VenvPex,
         PexRequest,
-        black.to_pex_request(interpreter_constraints=interpreter_constraints),
-    )
-    config_files_get = Get(
-        ConfigFiles, ConfigFilesRequest, black.config_request(request.snapshot.dirs)
+        black.to_pex_request(interpreter_constraints=request.interpreter_constraints),
     )
 
-    black_pex, config_files = await MultiGet(black_pex_get, config_files_get)
 
-    input_digest = await Get(
-        Digest, MergeDigests((request.snapshot.digest, config_files.snapshot.digest))
+async def _run_black(
+    request: AbstractFmtRequest.Batch,
+    black: Black,
+    interpreter_constraints: InterpreterConstraints,
+) -> FmtResult:
+    async def get_input_digest() -> Digest:
+        # Config discovery and the digest merge only depend on the request's snapshot, so run them
+        # concurrently with PEX resolution rather than stalling on it.
+        config_files = await Get(
+            ConfigFiles, ConfigFilesRequest, black.config_request(request.snapshot.dirs)
+        )
+        if config_files.snapshot.digest == EMPTY_DIGEST:
+            # No config files were discovered, so there is nothing to merge.
+            return request.snapshot.digest
+        return await Get(
+            Digest, MergeDigests((request.snapshot.digest, config_files.snapshot.digest))
+        )
+
+    black_pex, input_digest = await MultiGet(
+        Get(VenvPex, _BlackVenvRequest(interpreter_constraints)), get_input_digest()
     )
 
-    result = await Get(
-        ProcessResult,
-        VenvPexProcess(
-            black_pex,
-            argv=(
-                *(("--config", black.config) if black.config else ()),
-                "-W",
-                "{pants_concurrency}",
-                *black.args,
-                *request.files,
+    # Black is mostly single-threaded per invocation, so split large batches into shards and let
+    # the engine schedule one process per shard in parallel.
+    # NB: `Batch.files` is a property that rebuilds the tuple on each access, so read it once.
+    files = request.files
+    # Clamp the option so that a nonsensical value like 0 degrades to a single shard rather than
+    # erroring.
+    shard_count = max(1, math.ceil(len(files) / max(1, black.batch_size)))
+    shards = [files[i::shard_count] for i in range(shard_count)]
+    # Build the invariant argv prefix once, so each shard's argv is a single tuple concatenation
+    # rather than a chain of splats.
+    argv_prefix = []
+    if black.config:
+        argv_prefix += ["--config", black.config]
+    argv_prefix += ["-W", "{pants_concurrency}"]
+    argv_prefix.extend(black.args)
+    argv = tuple(argv_prefix)
+    results = await MultiGet(
+        Get(
+            ProcessResult,
+            VenvPexProcess(
+                black_pex,
+                argv=argv + shard,
+                input_digest=input_digest,
+                output_files=shard,
+                concurrency_available=len(shard),
+                description=f"Run Black on {pluralize(len(shard), 'file')}.",
+                level=LogLevel.DEBUG,
             ),
-            input_digest=input_digest,
-            output_files=request.files,
-            concurrency_available=len(request.files),
-            description=f"Run Black on {pluralize(len(request.files), 'file')}.",
-            level=LogLevel.DEBUG,
+        )
+        for shard in shards
+    )
+    output_snapshot = await Get(
+        Snapshot, MergeDigests(tuple(result.output_digest for result in results))
+    )
+    simplifier = Simplifier()
+    return FmtResult(
+        input=request.snapshot,
+        output=output_snapshot,
+        # Skip decoding and chroot-path stripping entirely for shards with no output, the common
+        # case when nothing was reformatted.
+        stdout="\n".join(
+            simplifier.simplify(result.stdout) for result in results if result.stdout
+        ),
+        stderr="\n".join(
+            simplifier.simplify(result.stderr) for result in results if result.stderr
         ),
+        tool_name=request.tool_name,
     )
-    return await FmtResult.create(request, result)
 
 
 @rule
@@ -81,8 +135,11 @@ async def partition_black(
     if black.options.is_default("interpreter_constraints"):
         try:
             # Don't compute this unless we have to, since it might fail.
+            # Dedupe the fields up front: many field sets share identical constraint values.
             all_interpreter_constraints = InterpreterConstraints.create_from_compatibility_fields(
-                (field_set.interpreter_constraints for field_set in request.field_sets),
+                FrozenOrderedSet(
+                    field_set.interpreter_constraints for field_set in request.field_sets
+                ),
                 python_setup,
             )
         except ValueError:
@@ -152,6 +152,31 @@ def test_multiple_targets(rule_runner: PythonRuleRunner) -> None:
     assert fmt_result.did_change is True
 
 
+def test_batch_size_sharding(rule_runner: PythonRuleRunner) -> None:
+    # NB: `--black-batch-size=1` forces one Black process per file, so this exercises merging the
+    # shards' output digests and joining their output.
+    rule_runner.write_files(
+        {
+            "good.py": GOOD_FILE,
+            "bad1.py": BAD_FILE,
+            "bad2.py": BAD_FILE,
+            "BUILD": "python_sources(name='t')",
+        }
+    )
+    tgts = [
+        rule_runner.get_target(Address("", target_name="t", relative_file_path="good.py")),
+        rule_runner.get_target(Address("", target_name="t", relative_file_path="bad1.py")),
+        rule_runner.get_target(Address("", target_name="t", relative_file_path="bad2.py")),
+    ]
+    fmt_result = run_black(rule_runner, tgts, extra_args=["--black-batch-size=1"])
+    assert fmt_result.stderr.count("1 file reformatted") == 2
+    assert fmt_result.stderr.count("1 file left unchanged") == 1
+    assert fmt_result.output == rule_runner.make_snapshot(
+        {"good.py": GOOD_FILE, "bad1.py": FIXED_BAD_FILE, "bad2.py": FIXED_BAD_FILE}
+    )
+    assert fmt_result.did_change is True
+
+
 @pytest.mark.parametrize(
     "config_path,extra_args",
     (["pyproject.toml", []], ["custom_config.toml", ["--black-config=custom_config.toml"]]),
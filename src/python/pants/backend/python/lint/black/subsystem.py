@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import os.path
 from dataclasses import dataclass
-from typing import Iterable
 
 from pants.backend.python.lint.black.skip_field import SkipBlackField
 from pants.backend.python.subsystems.python_tool_base import PythonToolBase
@@ -17,7 +16,8 @@ from pants.backend.python.target_types import (
 from pants.core.util_rules.config_files import ConfigFilesRequest
 from pants.engine.rules import collect_rules
 from pants.engine.target import FieldSet, Target
-from pants.option.option_types import ArgsListOption, BoolOption, FileOption, SkipOption
+from pants.option.option_types import ArgsListOption, BoolOption, FileOption, IntOption, SkipOption
+from pants.util.memo import memoized_method
 from pants.util.strutil import softwrap
 
 
@@ -63,6 +63,18 @@ class Black(PythonToolBase):
             """
         ),
     )
+    batch_size = IntOption(
+        advanced=True,
+        default=128,
+        help=softwrap(
+            """
+            The target number of files to include in a single Black process.
+
+            Each batch of files is formatted by its own process, so lowering this number
+            increases parallelism at the cost of more process startup overhead.
+            """
+        ),
+    )
     config_discovery = BoolOption(
         default=True,
         advanced=True,
@@ -76,9 +88,12 @@ class Black(PythonToolBase):
         ),
     )
 
-    def config_request(self, dirs: Iterable[str]) -> ConfigFilesRequest:
+    @memoized_method
+    def config_request(self, dirs: tuple[str, ...]) -> ConfigFilesRequest:
         # Refer to https://black.readthedocs.io/en/stable/usage_and_configuration/the_basics.html#where-black-looks-for-the-file
         # for how Black discovers config.
+        # Memoized so that repeated invocations over the same directories (e.g. successive batches
+        # of one partition) skip rebuilding the candidate map.
         candidates = {os.path.join(d, "pyproject.toml"): b"[tool.black]" for d in ("", *dirs)}
         return ConfigFilesRequest(
             specified=self.config,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import math
 from dataclasses import dataclass
 
 from pants.backend.python.lint.pyupgrade.skip_field import SkipPyUpgradeField
@@ -12,11 +13,12 @@ from pants.backend.python.util_rules import pex
 from pants.backend.python.util_rules.pex import PexRequest, VenvPex, VenvPexProcess
 from pants.core.goals.fix import FixResult, FixTargetsRequest
 from pants.core.util_rules.partitions import PartitionerType
+from pants.engine.fs import Digest, MergeDigests, Snapshot
 from pants.engine.process import FallibleProcessResult
-from pants.engine.rules import Get, collect_rules, rule
+from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import FieldSet, Target
 from pants.util.logging import LogLevel
-from pants.util.strutil import pluralize, softwrap
+from pants.util.strutil import Simplifier, pluralize, softwrap
 
 logger = logging.getLogger(__name__)
 
@@ -46,23 +48,41 @@ async def pyupgrade_fix(request: PyUpgradeRequest.Batch, pyupgrade: PyUpgrade) -
     # changing code. See https://github.com/asottile/pyupgrade/issues/703
     # (Technically we could not do this. It doesn't break Pants since the next run on the CLI would
     # use the new file with the new digest. However that isn't the UX we want for our users.)
+    # pyupgrade has no parallelism of its own, so split large batches into shards and let the
+    # engine schedule one process per shard in parallel.
+    # NB: `Batch.files` is a property that rebuilds the tuple on each access, so read it once.
+    files = request.files
+    # Clamp the option so that a nonsensical value like 0 degrades to a single shard rather than
+    # erroring.
+    shard_count = max(1, math.ceil(len(files) / max(1, pyupgrade.batch_size)))
+    shards = [files[i::shard_count] for i in range(shard_count)]
+    # Build the invariant argv prefix once, outside both the shard dispatch and the fix loop.
+    argv = tuple(pyupgrade.args)
+
     input_digest = request.snapshot.digest
+    results: tuple[FallibleProcessResult, ...] = ()
     for _ in range(10):  # Give the loop an upper bound to guard against infinite runs
-        result = await Get(  # noqa: PNT30: this is inherently sequential
-            FallibleProcessResult,
-            VenvPexProcess(
-                pyupgrade_pex,
-                argv=(*pyupgrade.args, *request.files),
-                input_digest=input_digest,
-                output_files=request.files,
-                description=f"Run pyupgrade on {pluralize(len(request.files), 'file')}.",
-                level=LogLevel.DEBUG,
-            ),
+        results = await MultiGet(  # noqa: PNT30: this is inherently sequential
+            Get(
+                FallibleProcessResult,
+                VenvPexProcess(
+                    pyupgrade_pex,
+                    argv=argv + shard,
+                    input_digest=input_digest,
+                    output_files=shard,
+                    description=f"Run pyupgrade on {pluralize(len(shard), 'file')}.",
+                    level=LogLevel.DEBUG,
+                ),
+            )
+            for shard in shards
+        )
+        output_digest = await Get(  # noqa: PNT30: this is inherently sequential
+            Digest, MergeDigests(tuple(result.output_digest for result in results))
         )
-        if input_digest == result.output_digest:
+        if input_digest == output_digest:
             # Nothing changed, either due to failure or because it is fixed
             break
-        input_digest = result.output_digest
+        input_digest = output_digest
     else:
         logger.error(
             softwrap(
@@ -75,7 +95,21 @@ async def pyupgrade_fix(request: PyUpgradeRequest.Batch, pyupgrade: PyUpgrade) -
             )
         )
 
-    return await FixResult.create(request, result)
+    output_snapshot = await Get(Snapshot, Digest, input_digest)
+    simplifier = Simplifier()
+    return FixResult(
+        input=request.snapshot,
+        output=output_snapshot,
+        # Skip decoding and chroot-path stripping entirely for shards with no output, the common
+        # case when pyupgrade made no rewrites.
+        stdout="\n".join(
+            simplifier.simplify(result.stdout) for result in results if result.stdout
+        ),
+        stderr="\n".join(
+            simplifier.simplify(result.stderr) for result in results if result.stderr
+        ),
+        tool_name=request.tool_name,
+    )
 
 
 def rules():
@@ -134,6 +134,34 @@ def test_multiple_targets(rule_runner: RuleRunner) -> None:
     assert fix_result.did_change is True
 
 
+def test_batch_size_sharding(rule_runner: RuleRunner) -> None:
+    # NB: `--pyupgrade-batch-size=1` forces one pyupgrade process per file, so this exercises
+    # merging the shards' output digests, including across the convergence loop's iterations.
+    percent_s_string_formatting = '"%s %s" % (foo, bar)\n'
+    rule_runner.write_files(
+        {
+            "good.py": PY_36_GOOD_FILE,
+            "bad.py": PY_36_BAD_FILE,
+            "format.py": percent_s_string_formatting,
+            "BUILD": "python_sources(name='t')",
+        }
+    )
+    tgts = [
+        rule_runner.get_target(Address("", target_name="t", relative_file_path="good.py")),
+        rule_runner.get_target(Address("", target_name="t", relative_file_path="bad.py")),
+        rule_runner.get_target(Address("", target_name="t", relative_file_path="format.py")),
+    ]
+    fix_result = run_pyupgrade(rule_runner, tgts, extra_args=["--pyupgrade-batch-size=1"])
+    assert fix_result.output == rule_runner.make_snapshot(
+        {
+            "good.py": PY_36_GOOD_FILE,
+            "bad.py": PY_36_FIXED_BAD_FILE,
+            "format.py": 'f"{foo} {bar}"\n',
+        }
+    )
+    assert fix_result.did_change is True
+
+
 def test_passthrough_args(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {"some_file_name.py": PY_38_BAD_FILE, "BUILD": "python_sources(name='t')"}
@@ -6,7 +6,8 @@ from __future__ import annotations
 from pants.backend.python.subsystems.python_tool_base import PythonToolBase
 from pants.backend.python.target_types import ConsoleScript
 from pants.engine.rules import collect_rules
-from pants.option.option_types import ArgsListOption, SkipOption
+from pants.option.option_types import ArgsListOption, IntOption, SkipOption
+from pants.util.strutil import softwrap
 
 
 class PyUpgrade(PythonToolBase):
@@ -25,6 +26,18 @@ class PyUpgrade(PythonToolBase):
 
     skip = SkipOption("fmt", "lint")
     args = ArgsListOption(example="--py39-plus --keep-runtime-typing")
+    batch_size = IntOption(
+        advanced=True,
+        default=128,
+        help=softwrap(
+            """
+            The target number of files to include in a single pyupgrade process.
+
+            Each batch of files is fixed by its own process, so lowering this number
+            increases parallelism at the cost of more process startup overhead.
+            """
+        ),
+    )
 
 
 def rules():
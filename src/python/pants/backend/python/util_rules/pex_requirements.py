@@ -286,7 +286,10 @@ class PexRequirements:
     # PEX-native lockfile, the superset to use. # NB: Use of a lockfile here asserts that the
     # lockfile is PEX-native, because legacy lockfiles do not support subset resolves.
     from_superset: Pex | Resolve | None
-    description_of_origin: str
+    # Excluded from equality: this is only used in error messages, and keeping it out of the
+    # cache key lets the engine dedupe resolves of the same requirements requested by different
+    # call sites (e.g. different tools sharing a resolve).
+    description_of_origin: str = field(compare=False)
 
     def __init__(
         self,
@@ -1,7 +1,8 @@
 # Copyright 2018 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, field
 
 from pants.build_graph.build_configuration import BuildConfiguration
 from pants.engine.internals.session import SessionValues
@@ -12,7 +13,21 @@ from pants.option.options import Options
 from pants.option.options_bootstrapper import OptionsBootstrapper
 from pants.option.scope import Scope, ScopedOptions
 from pants.util.logging import LogLevel
-from pants.util.memo import memoized_property
+
+
+@functools.lru_cache(maxsize=8)
+def _compute_full_options(
+    options_bootstrapper: OptionsBootstrapper,
+    build_config: BuildConfiguration,
+    union_membership: UnionMembership,
+) -> Options:
+    """Compute full options, deduping across equivalent `_Options` instances.
+
+    Option parsing is non-trivial, and all three inputs have useful `eq`/`hash`, so equivalent
+    `_Options` constructions can safely share one `Options` instance. A small cache suffices:
+    typically only one or two distinct input tuples exist per run.
+    """
+    return options_bootstrapper.full_options(build_config, union_membership)
 
 
 @dataclass(frozen=True)
@@ -26,15 +41,20 @@ class _Options:
     options_bootstrapper: OptionsBootstrapper
     build_config: BuildConfiguration
     union_membership: UnionMembership
+    # Not part of equality: derived from the other fields, which are the ones with useful `eq`.
+    options: Options = field(init=False, compare=False)
 
     def __post_init__(self) -> None:
-        # Touch the options property to ensure that it is eagerly initialized at construction time,
-        # rather than potentially much later in the presence of concurrency.
-        assert self.options is not None
-
-    @memoized_property
-    def options(self) -> Options:
-        return self.options_bootstrapper.full_options(self.build_config, self.union_membership)
+        # Compute the options eagerly at construction time, rather than potentially much later in
+        # the presence of concurrency. Storing them as a plain attribute (rather than behind a
+        # memoized property) makes each subsequent access a direct attribute read.
+        object.__setattr__(
+            self,
+            "options",
+            _compute_full_options(
+                self.options_bootstrapper, self.build_config, self.union_membership
+            ),
+        )
 
 
 @rule